@@ -0,0 +1,48 @@
+"""
+Google Cloud Storage Client
+
+Creating a client is expensive (authentication, TLS handshakes), so we create one
+per project and credentials and share it, and its connection pool, between all of
+the readers and writers in the process.
+"""
+import os
+import threading
+
+try:
+    from requests.adapters import HTTPAdapter  # type:ignore
+    from google.auth.credentials import AnonymousCredentials  # type:ignore
+    from google.cloud import storage  # type:ignore
+except ImportError:  # pragma: no cover
+    pass
+
+
+CONNECTION_POOL_SIZE = 64
+
+_CLIENT_CACHE: dict = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_client(project=None, credentials=None):
+    # connections can't be shared with forked processes, so each process gets
+    # its own client
+    key = (os.getpid(), project, credentials)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                # this means we're testing
+                if os.environ.get("STORAGE_EMULATOR_HOST") is not None:
+                    client = storage.Client(
+                        project=project, credentials=AnonymousCredentials()
+                    )
+                else:  # pragma: no cover
+                    client = storage.Client(project=project, credentials=credentials)
+                adapter = HTTPAdapter(
+                    pool_connections=CONNECTION_POOL_SIZE,
+                    pool_maxsize=CONNECTION_POOL_SIZE,
+                )
+                client._http.mount("https://", adapter)
+                client._http.mount("http://", adapter)
+                _CLIENT_CACHE[key] = client
+    return client
@@ -1,13 +1,15 @@
-import os
+import io
+
+from concurrent.futures import ThreadPoolExecutor
 
 from urllib3.exceptions import ProtocolError  # type:ignore
 
 from mabel.logging.create_logger import get_logger
 from mabel.data.writers.internals.base_inner_writer import BaseInnerWriter
 from mabel.errors import MissingDependencyError
+from .google_cloud_storage_client import get_client, CONNECTION_POOL_SIZE
 
 try:
-    from google.auth.credentials import AnonymousCredentials  # type:ignore
     from google.cloud import storage  # type:ignore
     from google.api_core import retry  # type:ignore
     from google.api_core.exceptions import (
@@ -20,15 +22,20 @@ except ImportError:  # pragma: no cover
     google_cloud_storage_installed = False
 
 
+MAX_CONCURRENCY = 16
+
+
 class GoogleCloudStorageWriter(BaseInnerWriter):
-    def __init__(self, credentials=None, **kwargs):
+    def __init__(self, project=None, credentials=None, **kwargs):
         if not google_cloud_storage_installed:  # pragma: no cover
             raise MissingDependencyError(
                 "`google-cloud-storage` is missing, please install or include in requirements.txt"
             )
 
         super().__init__(**kwargs)
+        self.project = project
         self.credentials = credentials
+        self.gcs_bucket = None
 
         predicate = retry.if_exception_type(
             ConnectionResetError, ProtocolError, InternalServerError, TooManyRequests
@@ -37,12 +44,11 @@ class GoogleCloudStorageWriter(BaseInnerWriter):
 
     def commit(self, byte_data, override_blob_name=None):
 
-        # this means we're testing
-        if os.environ.get("STORAGE_EMULATOR_HOST") is not None:
-            client = storage.Client(credentials=AnonymousCredentials())
-        else:  # pragma: no cover
-            client = storage.Client(credentials=self.credentials)
-        self.gcs_bucket = client.get_bucket(self.bucket)
+        # `bucket` creates a local handle, unlike `get_bucket` it doesn't make a
+        # call to GCS to get the bucket metadata
+        if self.gcs_bucket is None:
+            client = get_client(project=self.project, credentials=self.credentials)
+            self.gcs_bucket = client.bucket(self.bucket)
         self.filename = self.filename_without_bucket
 
         # if we've been given the filename, use that, otherwise get the
@@ -54,8 +60,17 @@ class GoogleCloudStorageWriter(BaseInnerWriter):
 
         try:
             blob = self.gcs_bucket.blob(blob_name)
-            self.retry(blob.upload_from_string)(
-                byte_data, content_type="application/octet-stream"
+            # `upload_from_string` only accepts `bytes`, uploading from a stream lets
+            # us accept any bytes-like object. BytesIO only avoids a copy for
+            # `bytes` (it shares the memory until the stream is written to), other
+            # bytes-like objects such as a `bytearray` are copied. The stream is
+            # rewound on each attempt so retries send the whole payload.
+            stream = io.BytesIO(byte_data)
+            self.retry(blob.upload_from_file)(
+                stream,
+                size=len(byte_data),
+                content_type="application/octet-stream",
+                rewind=True,
             )
             return blob_name
         except Exception as err:  # pragma: no cover
@@ -66,3 +81,26 @@ class GoogleCloudStorageWriter(BaseInnerWriter):
                 f"Error Saving Blob to GCS {type(err).__name__} - {err}\n{traceback.format_exc()}"
             )
             raise err
+
+    def commit_many(self, items, max_concurrency: int = MAX_CONCURRENCY):
+        """
+        Commit a set of blobs concurrently, GCS doesn't have a batch upload API
+        so we upload each blob on its own thread, sharing the client.
+
+        Parameters:
+            items: iterable of tuples
+                (blob_name, byte_data) pairs to commit
+            max_concurrency: integer (optional)
+                The maximum number of concurrent uploads, this is capped at the
+                size of the client's connection pool
+
+        Returns:
+            list of the committed blob names, in the order they were provided
+        """
+        max_concurrency = max(1, min(max_concurrency, CONNECTION_POOL_SIZE))
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [
+                executor.submit(self.commit, byte_data, override_blob_name=blob_name)
+                for blob_name, byte_data in items
+            ]
+            return [future.result() for future in futures]
@@ -23,11 +23,11 @@ limitations under the License.
 """
 # python setup.py build_ext --inplace
 
+import math
 import os
-import statistics
+import random
 
 from enum import Enum
-from functools import reduce
 from typing import Iterable, Dict, Any, Union
 from warnings import warn
 
@@ -72,6 +72,28 @@ class STORAGE_CLASS(int, Enum):
     COMPRESSED_MEMORY = 4
 
 
+def _variance(values):
+    """
+    Sample variance using Welford's algorithm, this is a single pass over the
+    values and, unlike summing the squares, is numerically stable. The result can
+    differ from `statistics.variance` in the last few digits.
+    """
+    count = 0
+    mean = 0
+    sum_of_squares = 0
+    for value in values:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        sum_of_squares += delta * (value - mean)
+    if count < 2:
+        # statistics is only needed for the exception, so only import it here
+        import statistics
+
+        raise statistics.StatisticsError("variance requires at least two data points")
+    return sum_of_squares / (count - 1)
+
+
 class DictSet(object):
     def __init__(
         self,
@@ -91,6 +113,8 @@ class DictSet(object):
                 into a Python `list`, DISK saves to disk - disk persistance is slower
                 but can handle much larger data sets. 'COMPRESSED_MEMORY' uses
                 compression to fit more in memory for a performance cost.
+                MEMORY takes ownership of a `list` iterator rather than copying
+                it, later changes to the list are seen by the DictSet.
         """
         self.storage_class = storage_class
         self._iterator = iterator
@@ -115,8 +139,10 @@ class DictSet(object):
         """
         Wrap the iterator in a Iterable object
         """
-        if not hasattr(self._iterator, "__iter__"):  # pragma:no cover
-            self._iterator = DumbIterator(self._iterator)
+        # the constructor has already made sure we can iterate the data, but
+        # collections, like lists, aren't iterators themselves
+        if not hasattr(self._iterator, "__next__"):
+            return iter(self._iterator)
         return self
 
     def __next__(self):
@@ -138,10 +164,11 @@ class DictSet(object):
         """
 
         def inner_sampler(dictset):
-            selector = int(1 / fraction)
+            # this doesn't need to be cryptographically secure, so rather than
+            # calling urandom for every row we only use it to seed the generator
+            random_value = random.Random(os.urandom(16)).random  # nosec
             for row in dictset:
-                random_value = int.from_bytes(os.urandom(2), "big")
-                if random_value % selector == 0:
+                if random_value() < fraction:
                     yield row
 
         return DictSet(
@@ -168,6 +195,13 @@ class DictSet(object):
             return list(asdic(iter(self._iterator)))
         return [record[key] for record in iter(self._iterator) if key in record]
 
+    def _iter_values(self, key: str):
+        """
+        Iterate over the values in a column, the aggregations use this rather than
+        `collect_list` so they don't need to hold the column in memory.
+        """
+        return (record[key] for record in iter(self._iterator) if key in record)
+
     def keys(self, number_of_rows: int = 0):
         """
         Get all of the keys from the _DictSet_. This iterates the entire
@@ -175,25 +209,30 @@ class DictSet(object):
         """
         if number_of_rows > 0:
             rows = self.itake(number_of_rows)
-            return reduce(
-                lambda x, y: x + [a for a in y.keys() if a not in x], rows, []
-            )
-        return reduce(
-            lambda x, y: x + [a for a in y.keys() if a not in x],
-            iter(self._iterator),
-            [],
-        )
+        else:
+            rows = iter(self._iterator)
+        # dictionaries keep insertion order, so this dedupes the keys and retains
+        # the order they were first seen in
+        seen = {}
+        for row in rows:
+            seen.update(dict.fromkeys(row))
+        return list(seen)
 
     def types(self, number_of_rows: int = 100):
-        top = self.take(number_of_rows)
+        # collect the types of the values in a single pass of the rows, this
+        # also means we can work out the types of non-persisted DictSets
+        column_types: dict = {}
+        for row in self.itake(number_of_rows):
+            for key, value in row.items():
+                key_types = column_types.setdefault(key, set())
+                if value is not None:
+                    key_types.add(type(value).__name__)
+
         response = {}
-        for key in top.keys():
-            key_type = {
-                type(val).__name__ for val in top.collect_list(key) if val != None
-            }
+        for key, key_type in column_types.items():
             if len(key_type) == 0:  # pragma: no cover
                 response[key] = "empty"
-            if len(key_type) == 1:
+            elif len(key_type) == 1:
                 response[key] = key_type.pop()
             elif sorted(key_type) == ["float", "int"]:
                 response[key] = "numeric"
@@ -209,7 +248,7 @@ class DictSet(object):
             key: string
                 The column to perform the function on
         """
-        return reduce(max, self.collect_list(key))
+        return max(self._iter_values(key))
 
     def sum(self, key: str):
         """
@@ -219,7 +258,7 @@ class DictSet(object):
             key: string
                 The column to perform the function on
         """
-        return reduce(lambda x, y: x + y, self.collect_list(key), 0)
+        return sum(self._iter_values(key))
 
     def min(self, key: str):
         """
@@ -229,7 +268,7 @@ class DictSet(object):
             key: string
                 The column to perform the function on
         """
-        return reduce(min, self.collect_list(key))
+        return min(self._iter_values(key))
 
     def min_max(self, key: str):
         """
@@ -242,11 +281,19 @@ class DictSet(object):
         Returns:
             tuple (minimum, maximum)
         """
-
-        def minmax(a, b):
-            return min(a[0], b[0]), max(a[1], b[1])
-
-        return reduce(minmax, map(lambda x: (x, x), self.collect_list(key)))
+        values = self._iter_values(key)
+        for minimum in values:
+            maximum = minimum
+            break
+        else:
+            # the same as min and max do for an empty column
+            raise ValueError("min_max() arg is an empty sequence")
+        for value in values:
+            if value < minimum:
+                minimum = value
+            elif value > maximum:
+                maximum = value
+        return minimum, maximum
 
     def mean(self, key: str):
         """
@@ -256,7 +303,15 @@ class DictSet(object):
             key: string
                 The column to perform the function on
         """
-        return statistics.mean(self.collect_list(key))
+        count = 0
+        total = 0
+        for count, value in enumerate(self._iter_values(key), 1):
+            total += value
+        if count == 0:
+            import statistics
+
+            raise statistics.StatisticsError("mean requires at least one data point")
+        return total / count
 
     def variance(self, key: str):
         """
@@ -266,7 +321,7 @@ class DictSet(object):
             key: string
                 The column to perform the function on
         """
-        return statistics.variance(self.collect_list(key))
+        return _variance(self._iter_values(key))
 
     def standard_deviation(self, key: str):
         """
@@ -276,7 +331,7 @@ class DictSet(object):
             key: string
                 The column to perform the function on
         """
-        return statistics.stdev(self.collect_list(key))
+        return math.sqrt(_variance(self._iter_values(key)))
 
     def count(self):
         """
@@ -296,23 +351,27 @@ class DictSet(object):
         Optionally accepts a list of columns, which we extract out and just
         'distinct' on these, ignoring differences in any of the other columns.
         """
-        hash_list = {}
+        seen = set()
 
         def do_dedupe(data):
             for item in data:
                 if columns:
+                    # serializing the values as a list keeps them apart, joining
+                    # them as strings made ("ab", "c") and ("a", "bc") the same
                     hashed_item = hash(
-                        "".join([str(item.get(c, "$$")) for c in columns])
+                        orjson.dumps(
+                            [item.get(c, "$$") for c in columns],
+                            default=str,
+                            option=orjson.OPT_NON_STR_KEYS,
+                        )
                     )
                 else:
-                    hashed_item = reduce(
-                        lambda x, y: x ^ y,
-                        [hash(f"{i},{v}") for i, v in enumerate(item.values())],
-                        0,
+                    hashed_item = hash(
+                        orjson.dumps(item, default=str, option=orjson.OPT_NON_STR_KEYS)
                     )
-                if hashed_item not in hash_list:
+                if hashed_item not in seen:
+                    seen.add(hashed_item)
                     yield item
-                    hash_list[hashed_item] = True
 
         return DictSet(
             do_dedupe(iter(self._iterator)), storage_class=self.storage_class
@@ -335,9 +394,12 @@ class DictSet(object):
         way possible to do this.
         """
 
-        # if there's no direct access to items, cycle through them
-        # yielding the items we want
-        if self.storage_class in (STORAGE_CLASS.DISK, STORAGE_CLASS.COMPRESSED_MEMORY):
+        # the storage classes know the fastest way to find their own items
+        if self.storage_class in (
+            STORAGE_CLASS.MEMORY,
+            STORAGE_CLASS.DISK,
+            STORAGE_CLASS.COMPRESSED_MEMORY,
+        ):
             for r in self._iterator._inner_reader(*locations):
                 yield r
             return
@@ -347,10 +409,15 @@ class DictSet(object):
             yield from [self._iterator[i] for i in locations]
             return
 
+        # otherwise cycle through the items once, yielding the ones we want
         if self.storage_class == STORAGE_CLASS.NO_PERSISTANCE:
-            for i, r in iter(self._iterator):
-                if i in locations:
+            wanted = set(locations)
+            last_location = max(wanted, default=-1)
+            for i, r in enumerate(iter(self._iterator)):
+                if i in wanted:
                     yield r
+                if i >= last_location:
+                    return
 
     def to_ascii_table(self, limit: int = 5):
         """
@@ -383,7 +450,23 @@ class DictSet(object):
             raise MissingDependencyError(
                 "`pandas` is missing, please install or include in requirements.txt"
             )
-        return pandas.DataFrame([r for r in iter(self._iterator)])
+
+        # build the DataFrame from columns rather than from a list of records,
+        # records missing a column are padded with NaN, as pandas does
+        columns: dict = {}
+        rows = 0
+        for record in iter(self._iterator):
+            for key, value in record.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [float("nan")] * rows
+                column.append(value)
+            rows += 1
+            if len(record) != len(columns):
+                for column in columns.values():
+                    if len(column) < rows:
+                        column.append(float("nan"))
+        return pandas.DataFrame(columns)
 
     def first(self) -> dict:
         """
@@ -422,17 +505,13 @@ class DictSet(object):
                 A function that takes a record as a parameter and should return
                 False for items to be filtered
         """
+        # the builtin `filter` runs the loop in C rather than in a generator
+
         # Where clause filtering
         if isinstance(filters, str):
-
-            def inner_filter_where(dictset):
-                for record in dictset:
-                    if q.evaluate(record):
-                        yield record
-
             q = Expression(filters)
             return DictSet(
-                inner_filter_where(iter(self._iterator)),
+                filter(q.evaluate, iter(self._iterator)),
                 storage_class=self.storage_class,
             )
 
@@ -446,14 +525,8 @@ class DictSet(object):
 
         # function filtering
         if hasattr(filters, "__call__"):
-
-            def inner_filter_callable(func, dictset):
-                for item in dictset:
-                    if func(item):
-                        yield item
-
             return DictSet(
-                inner_filter_callable(filters, iter(self._iterator)),
+                filter(filters, iter(self._iterator)),
                 storage_class=self.storage_class,
             )
 
@@ -486,6 +559,21 @@ class DictSet(object):
                 for record in it:
                     yield {k: v for k, v in record.items() if k != "*"}
 
+        elif all(type(column) is str for column in columns):
+            # build the projection once, the column names are literals in the
+            # generated code so each record is a single dictionary build. This
+            # is only done for exact `str` columns, a subclass could override
+            # `__repr__` and put any code into the source.
+            source = (
+                "lambda record: {"
+                + ", ".join(f"{column!r}: record.get({column!r})" for column in columns)
+                + "}"
+            )
+            projection = eval(source)  # nosec - names are escaped with repr
+
+            def inner_select(it):
+                yield from map(projection, it)
+
         else:
 
             def inner_select(it):
@@ -538,15 +626,15 @@ class DictSet(object):
         the items in the _DictSet_.
         """
 
-        def sip(val):
-            return siphash("TheApolloMission", val)
-
         # The seed is the mission duration of the Apollo 11 mission.
         #   703115 = 8 days, 3 hours, 18 minutes, 35 seconds
-        ordered = map(lambda record: dict(sorted(record.items())), iter(self._iterator))
-        serialized = map(orjson.dumps, ordered)
-        hashed = map(sip, serialized)
-        return reduce(lambda x, y: x ^ y, hashed, seed)
+        hashed = seed
+        for record in iter(self._iterator):
+            # only the top level keys are sorted, OPT_SORT_KEYS would also sort
+            # nested dicts and change the hashes of records which have them
+            serialized = orjson.dumps(dict(sorted(record.items())))
+            hashed ^= siphash("TheApolloMission", serialized)
+        return hashed
 
     def __repr__(self):  # pragma: no cover
         if is_running_from_ipython():
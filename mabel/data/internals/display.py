@@ -54,14 +54,14 @@ def html_table(dictset: Iterable[dict], limit: int = 5):
         yield "</tbody></table>"
 
     rows = []
-    columns = []  # type:ignore
+    # a dictionary rather than a set, so the columns are in the order we saw them
+    columns: dict = {}
     i = -1
     for i, row in enumerate(iter(dictset)):
         rows.append(row)
-        columns = columns + list(row.keys())
+        columns.update(dict.fromkeys(row))
         if (i + 1) == limit:
             break
-    columns = set(columns)  # type:ignore
 
     import types
 
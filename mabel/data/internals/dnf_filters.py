@@ -2,7 +2,7 @@
 This is a filtering mechanism to be applied when reading data.
 """
 import operator
-from typing import Optional, Iterable, List, Tuple, Union
+from typing import Callable, Optional, Iterable, List, Tuple, Union
 from ...errors import InvalidSyntaxError
 from ...logging import get_logger
 from ...utils.text import like, matches
@@ -91,9 +91,66 @@ def evaluate(predicate: Union[tuple, list], record: dict) -> bool:
     raise InvalidSyntaxError("Unable to evaluate Filter")  # pragma: no cover
 
 
+# the pattern matching operators are much more expensive to evaluate than the
+# comparisons, the collection operators may need to scan the collection
+EXPENSIVE_OPERATORS = {
+    "like",
+    "matches",
+    "~",
+    "in",
+    "!in",
+    "not in",
+    "contains",
+    "!contains",
+}
+
+
+def _cost(predicate) -> int:
+    if isinstance(predicate, tuple) and predicate[1].lower() in EXPENSIVE_OPERATORS:
+        return 1
+    return 0
+
+
+def _compile(predicate: Union[tuple, list]) -> Callable[[dict], bool]:
+    """
+    Convert a DNF predicate into a function which evaluates a record.
+
+    This follows the same rules as `evaluate` but the structure of the predicate
+    is only inspected once, rather than for every record, so the filter for each
+    record is just the closures for the comparisons. Unlike `evaluate`, unknown
+    operators fail (`KeyError`) when the predicate is compiled, not only when a
+    record with the key is evaluated.
+    """
+    if isinstance(predicate, tuple):
+        key, op, value = predicate
+        comparison = OPERATORS[op.lower()]
+
+        def _compare(record):
+            if key in record:
+                return comparison(record[key], value)
+            return False
+
+        return _compare
+
+    if isinstance(predicate, list):
+        # We AND them together (_all_ are True), the cheap comparisons are
+        # evaluated first so the expensive ones are skipped for records the
+        # cheap ones have already rejected
+        if all([isinstance(p, tuple) for p in predicate]):
+            evaluators = [_compile(p) for p in sorted(predicate, key=_cost)]
+            return lambda record: all(e(record) for e in evaluators)
+
+        # We OR them together (_any_ are True)
+        if all([isinstance(p, list) for p in predicate]):
+            evaluators = [_compile(p) for p in predicate]
+            return lambda record: any(e(record) for e in evaluators)
+
+    raise InvalidSyntaxError("Unable to evaluate Filter")  # pragma: no cover
+
+
 class DnfFilters:
 
-    __slots__ = ("empty_filter", "predicates")
+    __slots__ = ("empty_filter", "predicates", "_evaluator")
 
     def __init__(self, filters: Optional[List[Tuple[str, str, object]]] = None):
         """
@@ -122,8 +179,18 @@ class DnfFilters:
         if filters:
             self.predicates = filters
             self.empty_filter = False
+            # compiled on first use, filters converted from Expressions can have
+            # operators and shapes which can be used for index lookups but can't
+            # be evaluated, these should only fail if they're evaluated
+            self._evaluator = None
         else:
             self.empty_filter = True
+            self._evaluator = true
+
+    def _get_evaluator(self) -> Callable[[dict], bool]:
+        if self._evaluator is None:
+            self._evaluator = _compile(self.predicates)
+        return self._evaluator
 
     def _get_filter_columns(self, predicate):
         if predicate is None:
@@ -155,9 +222,7 @@ class DnfFilters:
         if self.empty_filter:
             yield from dictset
         else:
-            for record in dictset:
-                if evaluate(self.predicates, record):
-                    yield record
+            yield from filter(self._get_evaluator(), dictset)
 
     def __call__(self, record) -> bool:
-        return evaluate(self.predicates, record)
+        return self._get_evaluator()(record)
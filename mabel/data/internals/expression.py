@@ -38,6 +38,7 @@ class TreeNode:
 class Expression(object):
     tokenizer = None
     root = None
+    _evaluator = None
 
     def __init__(self, exp):
         self.tokenizer = Tokenizer(exp)
@@ -45,6 +46,7 @@ class Expression(object):
 
     def parse(self):
         self.root = self.parse_expression()
+        self._evaluator = self._compile(self.root)
 
     def parse_expression(self):
         andTerm1 = self.parse_and_term()
@@ -217,10 +219,73 @@ class Expression(object):
         return parse_iso(value) or value
 
     def evaluate(self, variable_dict):
-        return self.evaluate_recursive(self.root, variable_dict)
+        return self._evaluator(variable_dict)
 
     def __call__(self, variable_dict):
-        return self.evaluate_recursive(self.root, variable_dict)
+        return self._evaluator(variable_dict)
+
+    def _compile(self, treeNode):
+        """
+        Build a function to evaluate the tree, this follows the same rules as
+        `evaluate_recursive` but works out what to do at each node once, when the
+        expression is parsed, rather than for every record we evaluate.
+        """
+        if treeNode.token_type in (
+            TOKENS.INTEGER,
+            TOKENS.FLOAT,
+            TOKENS.LITERAL,
+            TOKENS.BOOLEAN,
+            TOKENS.NULL,
+            TOKENS.DATE,
+        ):
+            constant = treeNode.value
+            return lambda variable_dict: constant
+
+        if treeNode.token_type == TOKENS.VARIABLE:
+            name = treeNode.value
+            if name[0] == name[-1] == "`":
+                name = name[1:-1]
+            interpret_value = self.interpret_value
+
+            def _variable(variable_dict):
+                if name in variable_dict:
+                    return interpret_value(variable_dict[name])
+                return None
+
+            return _variable
+
+        left = self._compile(treeNode.left)
+
+        if treeNode.token_type == TOKENS.NOT:
+            return lambda variable_dict: not left(variable_dict)
+
+        right = self._compile(treeNode.right)
+
+        if treeNode.token_type == TOKENS.OPERATOR:
+            operator = OPERATORS[treeNode.value]
+
+            def _operator(variable_dict):
+                left_value = left(variable_dict)
+                right_value = right(variable_dict)
+                try:
+                    return operator(left_value, right_value)
+                except (TypeError, ValueError):
+                    return None
+
+            return _operator
+
+        if treeNode.token_type == TOKENS.AND:
+            return lambda variable_dict: left(variable_dict) and right(variable_dict)
+        if treeNode.token_type == TOKENS.OR:
+            return lambda variable_dict: left(variable_dict) or right(variable_dict)
+
+        # invalid expressions only fail when they're evaluated
+        def _invalid(variable_dict):
+            raise InvalidExpression(
+                f"Unexpected value of type `{str(treeNode.token_type)}`"
+            )
+
+        return _invalid
 
     def evaluate_recursive(self, treeNode, variable_dict):
         if treeNode.token_type in (
@@ -261,6 +326,25 @@ class Expression(object):
             f"Unexpected value of type `{str(treeNode.token_type)}`"
         )
 
+    def fields(self):
+        """
+        The set of fields from the record the expression reads.
+        """
+
+        def _inner(treeNode):
+            if treeNode is None:
+                return
+            if treeNode.token_type == TOKENS.VARIABLE:
+                name = treeNode.value
+                if name[0] == name[-1] == "`":
+                    name = name[1:-1]
+                yield name
+                return
+            yield from _inner(treeNode.left)
+            yield from _inner(treeNode.right)
+
+        return set(_inner(self.root))
+
     def to_dnf(self):
         """
         Converting to DNF as sometimes it's easier to deal with DNF than an
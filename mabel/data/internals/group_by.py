@@ -6,13 +6,12 @@ will be effective:
 python setup.py build_ext --inplace
 """
 import cython
+import decimal
 from siphashc import siphash
 from collections import defaultdict
 
 
 def summer(x, y):
-    import decimal
-
     return decimal.Decimal(x) + decimal.Decimal(y)
     # return x + y
 
@@ -121,24 +120,24 @@ class GroupBy:
             if func == "AVG":
                 aggregations += [("SUM", col), ("COUNT", col)]
 
-        columns_to_collect = {col for func, col in aggregations}
+        # index the aggregations by the column they're on, and build their names
+        # once, so each value is only tested against the aggregations it is for
+        aggregations_by_column = defaultdict(list)
+        for func, col in aggregations:
+            aggregations_by_column[col].append((func, f"{func}({col})"))
 
         collector = defaultdict(dict)
         # Iterate through the data in the groups formatted by the mapper. This data
         # is a list of Tuples of (GroupID, Column Name, Value)
-        for record in self._map(columns_to_collect):
+        for group_key, column, column_value in self._map(set(aggregations_by_column)):
+            group = collector[group_key]
             # For each aggregation, we need to perform the function against the
             # values as they come in - the collector holds the result up to this
             # point in the set.
-            for func, col in aggregations:
-
-                if col != record[1]:
-                    continue
-
-                key = f"{func}({col})"
+            for func, key in aggregations_by_column[column]:
 
-                existing = collector[record[0]].get(key)
-                value = record[2]
+                existing = group.get(key)
+                value = column_value
 
                 # the aggregation works by performing a simple calculation on
                 # the last known value and the value currently seen. This means
@@ -154,30 +153,30 @@ class GroupBy:
                     value = 1
 
                 # update the collector with the latest value
-                collector[record[0]][key] = value
+                group[key] = value
 
         # the order of the resulting data set is the order of the hashes - this
         # will appear random, but will ensure the order is consistent between
         # reruns.
         collector = dict(sorted(collector.items()))
 
+        # the names of the result columns are the same for every group, so build
+        # them once rather than for each group we emit
+        result_keys = [f"{func}({col})" for func, col in requested_aggs]
+        averages = [
+            (f"AVG({col})", f"SUM({col})", f"COUNT({col})")
+            for func, col in requested_aggs
+            if func == "AVG"
+        ]
+
         # We now need to expand out the hashed column names
         for group, results in collector.items():
 
-            for func, col in requested_aggs:
-                if func == "AVG":
-                    results[f"AVG({col})"] = (
-                        results[f"SUM({col})"] / results[f"COUNT({col})"]
-                    )
-
-            results = {
-                f"{func}({col})": results.get(f"{func}({col})")
-                for func, col in requested_aggs
-            }
+            for average, total, count in averages:
+                results[average] = results[total] / results[count]
 
-            keys = self._group_keys[group]
-            for key in keys:
-                results[key[0]] = key[1]
+            results = {key: results.get(key) for key in result_keys}
+            results.update(self._group_keys[group])
 
             yield results
 
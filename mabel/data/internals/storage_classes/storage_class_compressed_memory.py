@@ -24,6 +24,9 @@ class StorageClassCompressedMemory(BaseStorageClass):
         self.batches = []
         self.length = 0
 
+        # the batches are built by zipping the same iterator with itself, this
+        # needs an iterator, zipping a list would repeat the list in every slot
+        iterable = iter(iterable)
         batch = None
         for batch in zip_longest(*[iterable] * BATCH_SIZE):
             self.length += len(batch)
@@ -53,12 +56,14 @@ class StorageClassCompressedMemory(BaseStorageClass):
             batch_number = -1
             batch = []
             for i in ordered_location:
-                requested_batch = i % BATCH_SIZE
+                # the locations are sorted so we only decompress each batch once
+                requested_batch = i // BATCH_SIZE
                 if requested_batch != batch_number:
                     batch = self.parse_json(
                         decompressor.decompress(self.batches[requested_batch])
                     )
-                yield batch[i - i % BATCH_SIZE]
+                    batch_number = requested_batch
+                yield batch[i % BATCH_SIZE]
 
         else:
             for batch in self.batches:
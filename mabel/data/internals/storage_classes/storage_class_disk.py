@@ -5,17 +5,71 @@ for the DISK variation of the STORAGE CLASSES.
 The Reader and Writer are pretty fast, the bottleneck is the parsing and serialization
 of JSON data - this accounts for over 50% of the read/write times.
 """
-import atexit
 import mmap
 import os
+import queue
+import threading
+import weakref
 
-from tempfile import NamedTemporaryFile
+from tempfile import mkstemp
 
 from mabel.utils.paths import silent_remove
 from . import BaseStorageClass
 
 
 BUFFER_SIZE = 16 * 1024 * 1024  # 16Mb
+READ_BLOCK_SIZE = 1024 * 1024  # 1Mb
+
+
+class _WriteBehind:
+    """
+    Write buffers to a file on a background thread.
+
+    There is a pool of two buffers, one is filled while the other is written. The
+    buffers are reused rather than reallocated, they grow to the size they need to
+    be and only the used part of the buffer is written.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.error = None
+        self.pending: queue.Queue = queue.Queue()
+        self.free: queue.Queue = queue.Queue()
+        for i in range(2):
+            self.free.put(bytearray())
+        self.thread = threading.Thread(target=self._writer, daemon=True)
+        self.thread.start()
+
+    def _writer(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            buffer, used = item
+            # if a write has failed, keep taking buffers so we don't block the
+            # producer, the error is raised when we close
+            if self.error is None:
+                try:
+                    # a memoryview slice avoids copying the buffer
+                    self.file.write(memoryview(buffer)[:used])
+                except Exception as err:  # pragma: no cover
+                    self.error = err
+            self.free.put(buffer)
+
+    def get_buffer(self):
+        """
+        Get a buffer to fill, this blocks until a buffer has been written.
+        """
+        return self.free.get()
+
+    def write(self, buffer, used):
+        self.pending.put((buffer, used))
+
+    def close(self):
+        self.pending.put(None)
+        self.thread.join()
+        if self.error is not None:  # pragma: no cover
+            raise self.error
 
 
 class StorageClassDisk(BaseStorageClass):
@@ -28,42 +82,77 @@ class StorageClassDisk(BaseStorageClass):
         self.inner_reader = None
         self.length = -1
 
-        self.file = NamedTemporaryFile(prefix="mabel-dictset").name
-        atexit.register(silent_remove, filename=self.file)
-
-        buffer = bytearray()
-        with open(self.file, "wb") as f:
-            for self.length, row in enumerate(iterator):
-                # there is a penalty for using this object
-                if hasattr(row, "mini"):
-                    buffer.extend(row.mini + b"\n")
-                else:
-                    buffer.extend(self.dump_json(row) + b"\n")
-                if len(buffer) > (BUFFER_SIZE):
-                    f.write(buffer)
-                    buffer = bytearray()
-            if len(buffer) > 0:
-                f.write(buffer)
+        # mkstemp creates and opens the file in one step, we write to that handle
+        # rather than closing it and opening the file again by name
+        descriptor, self.file = mkstemp(prefix="mabel-dictset")
+        # remove the file when this object is garbage collected or, if that
+        # doesn't happen first, when the interpreter exits
+        weakref.finalize(self, silent_remove, filename=self.file)
+
+        with os.fdopen(descriptor, "wb") as f:
+            # writing is done on a separate thread so the disk is being written to
+            # while we serialize the next buffer
+            writer = _WriteBehind(f)
+            try:
+                buffer = writer.get_buffer()
+                used = 0
+                for self.length, row in enumerate(iterator):
+                    # there is a penalty for using this object
+                    if hasattr(row, "mini"):
+                        line = row.mini
+                    else:
+                        line = self.dump_json(row)
+                    # assigning to a slice overwrites the reused buffer in place,
+                    # it only grows the buffer if it isn't already big enough
+                    end = used + len(line)
+                    buffer[used:end] = line
+                    buffer[end : end + 1] = b"\n"
+                    used = end + 1
+                    if used > BUFFER_SIZE:
+                        writer.write(buffer, used)
+                        buffer = writer.get_buffer()
+                        used = 0
+                if used > 0:
+                    writer.write(buffer, used)
+            finally:
+                writer.close()
             f.flush()
 
         self.length += 1
         self.iterator = None
 
-    def _read_file(self):
+    def _read_blocks(self):
         """
         MMAP is by far the fastest way to read files in Python.
+
+        We read the file in blocks and split the lines ourselves, this is much
+        faster than calling `readline` for each line. Each block is yielded as a
+        list of lines.
         """
+        # you can't mmap an empty file
+        if self.length == 0:
+            return
         with open(self.file, mode="rb") as file_obj:
             with mmap.mmap(
                 file_obj.fileno(), length=0, access=mmap.ACCESS_READ
             ) as mmap_obj:
-                line = mmap_obj.readline()
-                while line:
-                    yield line
-                    line = mmap_obj.readline()
+                # the end of each block is usually part of a line, carry it over
+                # to the next block
+                tail = b""
+                for block in iter(lambda: mmap_obj.read(READ_BLOCK_SIZE), b""):
+                    lines = (tail + block).split(b"\n")
+                    tail = lines.pop()
+                    yield lines
+                if tail:
+                    yield [tail]
+
+    def _read_file(self):
+        for lines in self._read_blocks():
+            yield from lines
 
     def _inner_reader(self, *locations):
         if locations:
+            locations = set(locations)
             max_location = max(locations)
             min_location = min(locations)
 
@@ -78,8 +167,11 @@ class StorageClassDisk(BaseStorageClass):
                     if i == max_location:
                         return
         else:
-            for line in self._read_file():
-                yield self.parse_json(line)
+            # parsing a block of lines as a single JSON array is much faster than
+            # parsing each line on its own
+            for lines in self._read_blocks():
+                if lines:
+                    yield from self.parse_json(b"[" + b",".join(lines) + b"]")
 
     def __iter__(self):
         self.iterator = iter(self._inner_reader())
@@ -92,9 +184,3 @@ class StorageClassDisk(BaseStorageClass):
 
     def __len__(self):
         return self.length
-
-    def __del__(self):
-        try:
-            os.remove(self.file)
-        except:  # nosec
-            pass
@@ -4,12 +4,19 @@ from . import BaseStorageClass
 class StorageClassMemory(BaseStorageClass):
     """
     This provides the reader for the MEMORY variation of STORAGE.
+
+    Lists are used as-is rather than copied, the storage takes ownership of the
+    list so changes made to it afterwards are seen by the storage.
     """
 
     def __init__(self, iterator):
         self.inner_reader = None
-        self.data = list(iterator)
-        self.length = len(self.data)
+        # if we've been given a list, don't make a copy of it, the length isn't
+        # cached so it always agrees with the list
+        if isinstance(iterator, list):
+            self.data = iterator
+        else:
+            self.data = list(iterator)
         self.iterator = None
 
     def _inner_reader(self, *locations):
@@ -28,4 +35,4 @@ class StorageClassMemory(BaseStorageClass):
         return next(self.iterator)
 
     def __len__(self):
-        return self.length
+        return len(self.data)
@@ -54,8 +54,10 @@ def parquet(stream):
             "`pyarrow` is missing, please install or include in requirements.txt"
         )
 
-    table = pq.read_table(stream)
-    yield from table.to_pylist()
+    # convert the file to Python objects a batch at a time, converting the whole
+    # table at once holds every value in the file as a Python object
+    for batch in pq.ParquetFile(stream).iter_batches():
+        yield from batch.to_pylist()
 
 
 def lines(stream):
@@ -232,10 +232,24 @@ class Evaluator:
         tokens = [t.strip() for t in reg.split(proforma) if t.strip() not in ("", ",")]
         self.tokens = build(tokens)
         self._iter = None
+        # this doesn't change between records so only work it out once
+        self._everything = any(t["type"] == TOKENS.EVERYTHING for t in self.tokens)
+        # if we're only selecting fields, we can just look them up; these are
+        # the (label, field) pairs `evaluate_field` would create for them
+        self._variables = None
+        if all(t["type"] == TOKENS.VARIABLE for t in self.tokens):
+            self._variables = []
+            for token in self.tokens:
+                field = token["value"]
+                if field[0] == field[-1] == "`":
+                    field = field[1:-1]
+                self._variables.append((token["value"], field))
 
     def __call__(self, dic):
+        if self._variables:
+            return {label: dic.get(field) for label, field in self._variables}
         builder = {}
-        if any(t["type"] == TOKENS.EVERYTHING for t in self.tokens):
+        if self._everything:
             if hasattr(dic, "as_dict"):
                 builder = dic.as_dict()
             else:
@@ -255,3 +269,22 @@ class Evaluator:
 
     def fields(self):
         return get_fields(self.tokens)
+
+    def passes_through(self, fields):
+        """
+        Do the records this creates have the same values for the fields as the
+        records it is given, i.e. are the fields selected as-is and not replaced
+        by any of the other values being created.
+        """
+        selected = set()
+        created = set()
+        for token in self.tokens:
+            if token["type"] == TOKENS.EVERYTHING:
+                continue
+            if token["type"] == TOKENS.VARIABLE and not token["as"]:
+                selected.add(token["value"])
+            else:
+                created.update(get_fields([token]))
+        if not self._everything and not set(fields).issubset(selected):
+            return False
+        return created.isdisjoint(fields)
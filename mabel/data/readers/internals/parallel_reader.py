@@ -24,12 +24,12 @@ dataset:
 from mabel import logging
 from . import decompressors, parsers
 from enum import Enum
-from functools import reduce
 from ....utils import paths
 from ....data.internals.records import flatten
 from ....data.internals.index import Index
 from ....data.internals.expression import Expression
 from ....data.internals.dnf_filters import DnfFilters
+from .inline_evaluator import Evaluator
 
 logger = logging.get_logger()
 
@@ -124,6 +124,16 @@ class ParallelReader:
         # against more operators
         self.filters = filters
 
+        # if the filter only reads fields the selection passes through unchanged
+        # we can filter before the selection, so we don't build the selected
+        # records for rows we're going to discard. Missing fields are `None` to an
+        # Expression either way, this isn't true for DNF filters.
+        self.filter_first = (
+            isinstance(filters, Expression)
+            and isinstance(columns, Evaluator)
+            and columns.passes_through(filters.fields())
+        )
+
         # this is aggregation and reducers for the data
         self.reducer = reducer
 
@@ -166,20 +176,28 @@ class ParallelReader:
                         for index_file in index_files
                         if f".{key}." in index_file
                     ]:
-                        index = Index(self.reader.get_blob_stream(index_file))
+                        index = Index(self.reader.read_blob(index_file))
                         return index.search(values)
 
                 return self.NOT_INDEXED
 
             if isinstance(predicate, list):
                 # Are all of the entries tuples? These are ANDed together.
-                rows = []
+                # Predicates without an index can't narrow the rows, they're
+                # skipped here and applied when the rows are filtered.
                 if all([isinstance(p, tuple) for p in predicate]):
-                    for index, row in enumerate(predicate):
-                        if index == 0:
-                            rows = _inner_prefilter(row)
+                    rows = None
+                    for row in predicate:
+                        evaluation = _inner_prefilter(row)
+                        if evaluation is self.NOT_INDEXED:
+                            continue
+                        if rows is None:
+                            rows = list(evaluation)
                         else:
-                            rows = [p for p in _inner_prefilter(row) if p in rows]
+                            matches = set(evaluation)
+                            rows = [p for p in rows if p in matches]
+                    if rows is None:
+                        return self.NOT_INDEXED
                     return rows
 
                 # Are all of the entries lists? These are ORed together.
@@ -187,14 +205,11 @@ class ParallelReader:
                 # able to prefilter.
                 if all([isinstance(p, list) for p in predicate]):
                     evaluations = [_inner_prefilter(p) for p in predicate]
-                    if not all([e == self.NOT_INDEXED for e in evaluations]):
+                    if not all(isinstance(e, list) for e in evaluations):
                         return self.NOT_INDEXED
-                    else:
-                        # join the data sets together by adding them
-                        rows = reduce(
-                            lambda x, y: x + _inner_prefilter(y), predicate, []
-                        )
-                    return rows
+                    # join the data sets together, we already have each of them
+                    # so we don't need to search the indexes again
+                    return [row for evaluation in evaluations for row in evaluation]
 
                 # if we're here the structure of the filter is wrong
                 return self.NOT_INDEXED
@@ -244,10 +259,16 @@ class ParallelReader:
             record_iterator = map(parser, record_iterator)
             # Expand Nested JSON
             # record_iterator = map(expand_nested_json, record_iterator)
-            # Transform
-            record_iterator = map(self.columns, record_iterator)
-            # Filter
-            record_iterator = filter(self.filters, record_iterator)
+            if self.filter_first:
+                # Filter
+                record_iterator = filter(self.filters, record_iterator)
+                # Transform
+                record_iterator = map(self.columns, record_iterator)
+            else:
+                # Transform
+                record_iterator = map(self.columns, record_iterator)
+                # Filter
+                record_iterator = filter(self.filters, record_iterator)
             # Reduce
             record_iterator = self.reducer(record_iterator)
             # Yield
@@ -1,17 +1,31 @@
 import datetime
 import decimal
 import os
+import sys
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Union, List, Dict
 
 import orjson
 
-from mabel.errors import ValidationError
+from mabel.errors import MissingDependencyError, ValidationError
+
+# the exact types which pass each validator without further checks, values of
+# other types (subclasses and pyarrow scalars) take the slower path
+NONE_TYPE = type(None)
+BOOLEAN_TYPES = {bool, NONE_TYPE}
+DATE_TYPES = {datetime.datetime, NONE_TYPE}
+NUMERIC_TYPES = {int, float, NONE_TYPE}
+STRING_TYPES = {str, NONE_TYPE}
+STRUCT_TYPES = {dict, NONE_TYPE}
 
 
 def is_boolean(**kwargs):
     def _inner(value: Any) -> bool:
         """BOOLEAN"""
+        if type(value) in BOOLEAN_TYPES:
+            return True
         if hasattr(value, "as_py"):
             value = value.as_py()
         return isinstance(value, bool) or value is None
@@ -22,6 +36,8 @@ def is_boolean(**kwargs):
 def is_date(**kwargs):
     def _inner(value: Any) -> bool:
         """TIMESTAMP"""
+        if type(value) in DATE_TYPES:
+            return True
         if hasattr(value, "as_py"):
             value = value.as_py()
         return isinstance(value, datetime.datetime) or value is None
@@ -32,6 +48,10 @@ def is_date(**kwargs):
 def is_list(**kwargs):
     def _inner(value: Any) -> bool:
         """LIST"""
+        if value is None:
+            return True
+        if type(value) is list:
+            return all(type(i) == str for i in value)
         if hasattr(value, "as_py"):
             value = value.as_py()
         if value is None:
@@ -46,6 +66,8 @@ def is_list(**kwargs):
 def is_numeric(**kwargs):
     def _inner(value: Any) -> bool:
         """NUMERIC"""
+        if type(value) in NUMERIC_TYPES:
+            return True
         if hasattr(value, "as_py"):
             value = value.as_py()
         return isinstance(value, (int, float, decimal.Decimal)) or value is None
@@ -56,6 +78,8 @@ def is_numeric(**kwargs):
 def is_string(**kwargs):
     def _inner(value: Any) -> bool:
         """VARCHAR"""
+        if type(value) in STRING_TYPES:
+            return True
         if hasattr(value, "as_py"):
             value = value.as_py()
         return isinstance(value, str) or value is None
@@ -66,6 +90,8 @@ def is_string(**kwargs):
 def is_struct(**kwargs):
     def _inner(value: Any) -> bool:
         """STRUCT"""
+        if type(value) in STRUCT_TYPES:
+            return True
         if hasattr(value, "as_py"):
             value = value.as_py()
         return isinstance(value, dict) or value is None
@@ -85,6 +111,61 @@ VALIDATORS = {
     "STRUCT": is_struct,
 }
 
+# pandas dtype kinds which can only hold values which pass the type's validator,
+# columns of these kinds don't need their values testing
+FRAME_KINDS = {"NUMERIC": "biuf", "BOOLEAN": "b", "TIMESTAMP": "M"}
+
+
+def _compile(validators: Dict[str, Any], columns: frozenset):
+    """
+    Build a single function which tests a record against all of the validators,
+    stopping at the first failure. This is the success path, the reasons for
+    failing are only collected when this returns False.
+    """
+    checks = tuple(validators.items())
+    issuperset = columns.issuperset
+
+    def _conforms(subject: dict) -> bool:
+        # find columns in the data, not in the schema
+        if not issuperset(subject):
+            return False
+        get = subject.get
+        for key, validator in checks:
+            if not validator(get(key)):
+                return False
+        return True
+
+    return _conforms
+
+
+@lru_cache(128)
+def _build(fields: tuple):
+    """
+    Look up the validators for a set of (name, type) pairs and compile them.
+
+    Schemas are commonly created with the same definition many times, the
+    validators hold no state so the results are shared between Schemas. They're
+    returned as a read-only mapping and a frozenset so one Schema can't change
+    another.
+    """
+    try:
+        # read the schema and look up the validators, the names are interned so
+        # looking them up in records with interned keys can compare identities
+        validators = {}
+        for name, type_name in fields:
+            if isinstance(name, str):
+                name = sys.intern(name)
+            validators[name] = VALIDATORS[type_name]()
+    except KeyError as e:
+        raise ValueError(
+            f"Invalid type specified in schema - {e}. Valid types are: {', '.join(VALIDATORS.keys())}"
+        )
+    if len(validators) == 0:
+        raise ValueError("Invalid schema specification")
+
+    columns = frozenset(validators.keys())
+    return MappingProxyType(validators), columns, _compile(validators, columns)
+
 
 class Schema:
     def __init__(self, definition: Union[str, List[Dict[str, Any]], dict]):
@@ -101,10 +182,10 @@ class Schema:
 
         # if we have a schema as a string, load it into a dictionary
         if isinstance(definition, str):
-            if os.path.exists(definition):  # type:ignore
-                definition = orjson.loads(
-                    open(definition, mode="r").read()
-                )  # type:ignore
+            if os.path.isfile(definition):  # type:ignore
+                # orjson parses bytes, so don't decode the file
+                with open(definition, mode="rb") as schema_file:  # type:ignore
+                    definition = orjson.loads(schema_file.read())
             else:
                 definition = orjson.loads(definition)  # type:ignore
 
@@ -114,22 +195,15 @@ class Schema:
 
         self.definition = definition
 
-        try:
-            # read the schema and look up the validators
-            self._validators = {  # type:ignore
-                item.get("name"): VALIDATORS[item.get("type")]()  # type:ignore
-                for item in definition  # type:ignore
-            }
-
-        except KeyError as e:
-            print(e)
-            raise ValueError(
-                f"Invalid type specified in schema - {e}. Valid types are: {', '.join(VALIDATORS.keys())}"
-            )
-        if len(self._validators) == 0:
-            raise ValueError("Invalid schema specification")
-
-        self._validator_columns = set(self._validators.keys())
+        fields = tuple(
+            (item.get("name"), item.get("type")) for item in definition  # type:ignore
+        )
+        (
+            self._validators,
+            self._validator_columns,
+            self._compiled,
+        ) = _build(fields)
+        self._types = dict(fields)
 
     def _field_validator(self, value, validator) -> bool:
         """
@@ -157,8 +231,11 @@ class Schema:
         Raises:
             ValidationError
         """
-        result = True
         self.last_error = ""
+        if self._compiled(subject):
+            return True
+
+        result = True
 
         # find columns in the data, not in the schema
         # Note: fields in the schema but not in the data passes schema validation
@@ -171,20 +248,55 @@ class Schema:
             if not self._field_validator(subject.get(key), value):
                 result = False
                 self.last_error += f"'{key}' (`{subject.get(key)}`) did not pass `{value.__doc__}` validator.\n"
+
         if raise_exception and not result:
             raise ValidationError(
                 f"Record does not conform to schema - {self.last_error}. "
             )
         return result
 
+    def validate_frame(self, frame):
+        """
+        Test each row of a _Pandas_ DataFrame against the Schema.
+
+        Columns are tested as a whole where their dtype means every value passes,
+        otherwise each value is tested. Nulls pass, as fields missing from a
+        record do, and columns not in the Schema only fail the rows where they
+        have a value.
+
+        Parameters:
+            frame: pandas.DataFrame
+                The DataFrame to test for conformity
+
+        Returns:
+            pandas Series of booleans, True where the row conforms
+        """
+        try:
+            import pandas
+        except ImportError:  # pragma: no cover
+            raise MissingDependencyError(
+                "`pandas` is missing, please install or include in requirements.txt"
+            )
+
+        result = pandas.Series(True, index=frame.index)
+        for name, column in frame.items():
+            nulls = column.isna()
+            if name not in self._validators:
+                result &= nulls
+            elif column.dtype.kind not in FRAME_KINDS.get(self._types[name], ""):
+                result &= nulls | column.map(self._validators[name]).astype(bool)
+        return result
+
     @property
     def columns(self):
         return self._validator_columns
 
-    def __call__(self, subject: dict = {}, raise_exception=False) -> bool:
+    def __call__(self, subject: dict = None, raise_exception=False) -> bool:  # type:ignore
         """
         Alias for validate
         """
+        if subject is None:
+            subject = {}
         return self.validate(subject=subject, raise_exception=raise_exception)
 
     def __str__(self):
@@ -90,7 +90,10 @@ class BlobWriter(object):
 
         self.schema = schema
 
-    def arrow_append(self, record: dict = {}):
+    def arrow_append(self, record: dict = None):  # type:ignore
+        if record is None:
+            # the record is kept in the buffer, so each needs to be its own dict
+            record = {}
         record_length = get_size(record)
         # if this write would exceed the blob size, close it
         if (
@@ -103,7 +106,9 @@ class BlobWriter(object):
         self.records_in_buffer += 1
         self.buffer.append(record)  # type:ignore
 
-    def text_append(self, record: dict = {}):
+    def text_append(self, record: dict = None):  # type:ignore
+        if record is None:
+            record = {}
         # serialize the record
         if self.format == "text":
             if isinstance(record, bytes):
@@ -192,7 +197,6 @@ class BlobWriter(object):
                         )
 
                     import io
-                    from functools import reduce
 
                     tempfile = io.BytesIO()
 
@@ -202,20 +206,20 @@ class BlobWriter(object):
                     # entire dataset and ensure all records have the same columns.
 
                     # first, we get all the columns, from all the records
-                    columns = reduce(
-                        lambda x, y: x + [a for a in y.keys() if a not in x],
-                        self.buffer,
-                        [],
+                    columns: dict = {}
+                    for row in self.buffer:
+                        columns.update(dict.fromkeys(row))
+                    columns = sorted(columns)  # type:ignore
+
+                    # then we build the table a column at a time, every record
+                    # contributes a value (or a null) to every column, this saves
+                    # rebuilding each record with the full set of columns
+                    pytable = pyarrow.Table.from_pydict(
+                        {
+                            column: [row.get(column) for row in self.buffer]
+                            for column in columns
+                        }
                     )
-                    columns = sorted(columns)
-
-                    # then we make sure each row has all the columns
-                    self.buffer = [
-                        {column: row.get(column) for column in columns}
-                        for row in self.buffer
-                    ]
-
-                    pytable = pyarrow.Table.from_pylist(self.buffer)
 
                     # if we have a schema, make effort to align the parquet file to it
                     if self.schema:
@@ -225,8 +229,7 @@ class BlobWriter(object):
                         pytable, where=tempfile, compression="zstd"
                     )
 
-                    tempfile.seek(0)
-                    self.buffer = tempfile.read()
+                    self.buffer = tempfile.getvalue()
 
                 if self.format == "zstd":
                     # zstandard is an non-optional installed dependency
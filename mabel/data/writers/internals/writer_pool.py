@@ -48,8 +48,9 @@ class WriterPool:
         }
         return new_writer
 
-    def remove_writer(self, identity):
-        # remove a writer from the pool and commit
+    def take_writer(self, identity):
+        # remove a writer from the pool without committing it, the caller is
+        # responsible for committing the writer
         lock = threading.Lock()
         try:
             lock.acquire(blocking=True, timeout=10)
@@ -61,15 +62,18 @@ class WriterPool:
                 logger.error(
                     f"Unable to find writer to remove - indentity={identity}, poolsize={len(self.writers)}"
                 )
-            else:
-                writer = writers[0]
-                self.writers = [
-                    w for w in self.writers if w.get("identity") != identity
-                ]
-                writer.get("writer").commit()
+                return None
+            self.writers = [w for w in self.writers if w.get("identity") != identity]
+            return writers[0].get("writer")
         finally:
             lock.release()
 
+    def remove_writer(self, identity):
+        # remove a writer from the pool and commit
+        writer = self.take_writer(identity)
+        if writer is not None:
+            writer.commit()
+
     def close(self):
         # evict everyone from the pool
         lock = threading.Lock()
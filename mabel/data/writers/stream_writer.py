@@ -72,6 +72,13 @@ class StreamWriter(Writer):
         self.writer_pool_capacity = writer_pool_capacity
         self.writer_pool = WriterPool(pool_size=writer_pool_capacity, **kwargs)
 
+        # set when the pool attendant has emptied the pool, so callers can wait
+        # for the open blobs to be committed. The lock is shared by appends and
+        # the pool attendant, it covers changes to the pool and to the event.
+        self._idle = threading.Event()
+        self._idle.set()
+        self._lock = threading.Lock()
+
         # establish the background thread responsible for the pool
         self.thread = threading.Thread(target=self.pool_attendant)
         self.thread.name = "mabel-writer-pool-attendant"
@@ -116,9 +123,11 @@ class StreamWriter(Writer):
                 f"Schema Validation Failed ({self.schema.last_error}) - message being written to {identity}"
             )
 
-        lock = threading.Lock()
+        self._lock.acquire()
         try:
-            lock.acquire(blocking=True, timeout=10)
+            # writers are about to be written to, the pool isn't idle until
+            # they've been committed
+            self._idle.clear()
 
             # get the placeholders from the dataset name
             placeholders = set(re.findall(r"\{(.*?)\}", identity))
@@ -156,38 +165,72 @@ class StreamWriter(Writer):
                 blob_writer.append(record)
                 writes += 1
         finally:
-            lock.release()
+            self._lock.release()
 
         return writes
 
     def finalize(self, **kwargs):
+        # let the attendant finish committing anything it has already evicted
         self.run_pool_attendant = False
-        lock = threading.Lock()
+        self.thread.join()
+        self._lock.acquire()
         try:
-            lock.acquire(blocking=True, timeout=10)
-            for blob_writer_identity in self.writer_pool.writers:
-                try:
-                    get_logger().debug(
-                        f"Removing from the writer pool during finalization, identity={blob_writer_identity['identity']}, poolsize={len(self.writer_pool.writers)}"
-                    )
-                    self.writer_pool.remove_writer(blob_writer_identity["identity"])
-                except Exception as err:
-                    get_logger().debug(
-                        f"Error finalizing `{blob_writer_identity}`, {type(err).__name__} - {err}"
-                    )
+            blob_writers = [
+                (writer["identity"], self.writer_pool.take_writer(writer["identity"]))
+                for writer in self.writer_pool.writers
+            ]
         finally:
-            lock.release()
+            self._lock.release()
+
+        # commit outside of the lock, so appends aren't held up by the I/O
+        for blob_writer_identity, blob_writer in blob_writers:
+            try:
+                get_logger().debug(
+                    f"Removing from the writer pool during finalization, identity={blob_writer_identity}, poolsize={len(self.writer_pool.writers)}"
+                )
+                if blob_writer is not None:
+                    blob_writer.commit()
+            except Exception as err:
+                get_logger().debug(
+                    f"Error finalizing `{blob_writer_identity}`, {type(err).__name__} - {err}"
+                )
+
+        self._set_idle_if_empty()
         return super().finalize()
 
+    def wait_idle(self, timeout: float = None) -> bool:  # type:ignore
+        """
+        Wait for the pool attendant to evict and commit all of the writers in
+        the pool, this happens when no records have been appended for the
+        idle timeout.
+
+        Parameters:
+            timeout: float (optional)
+                The maximum number of seconds to wait, default is to wait
+                indefinitely
+
+        Returns:
+            boolean, True if the pool is empty
+        """
+        return self._idle.wait(timeout)
+
+    def _set_idle_if_empty(self):
+        # only called once any writers taken from the pool have been committed
+        self._lock.acquire()
+        try:
+            if len(self.writer_pool.writers) == 0:
+                self._idle.set()
+        finally:
+            self._lock.release()
+
     def pool_attendant(self):
         """
         Writer Pool Management
         """
         while self.run_pool_attendant:
-            lock = threading.Lock()
+            evicted = []
+            self._lock.acquire()
             try:
-                lock.acquire(blocking=True, timeout=10)
-
                 # search for pool occupants who haven't had a write recently
                 for blob_writer_identity in self.writer_pool.get_stale_writers(
                     self.idle_timeout_seconds
@@ -195,7 +238,7 @@ class StreamWriter(Writer):
                     get_logger().debug(
                         f"Evicting {blob_writer_identity} from the writer pool due to inactivity - limit is {self.idle_timeout_seconds} seconds, poolsize={len(self.writer_pool.writers)}"
                     )
-                    self.writer_pool.remove_writer(blob_writer_identity)
+                    evicted.append(self.writer_pool.take_writer(blob_writer_identity))
                 # if we're over capacity, evict the LRU writers
                 for (
                     blob_writer_identity
@@ -203,11 +246,17 @@ class StreamWriter(Writer):
                     get_logger().debug(
                         f"Evicting {blob_writer_identity} from the writer pool due the pool being over its {self.writer_pool_capacity} capacity, poolsize={len(self.writer_pool.writers)}"
                     )
-                    self.writer_pool.remove_writer(blob_writer_identity)
-
+                    evicted.append(self.writer_pool.take_writer(blob_writer_identity))
             finally:
-                lock.release()
+                self._lock.release()
+
+            # the evicted writers are out of the pool, so they're committed
+            # outside of the lock and appends aren't held up by the I/O
+            for blob_writer in evicted:
+                if blob_writer is not None:
+                    blob_writer.commit()
 
+            self._set_idle_if_empty()
             time.sleep(0.1)
 
         get_logger().debug("Pool attendant off-duty")
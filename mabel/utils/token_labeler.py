@@ -17,6 +17,10 @@ from ..data.internals.group_by import AGGREGATORS
 
 # These are the characters we should escape in our regex
 REGEX_CHARACTERS = {ch: "\\" + ch for ch in ".^$*+?{}[]|()\\"}
+# the characters which can wrap a token
+QUOTE_CHARACTERS = {'"', "'", "`"}
+# runs of whitespace, including carriage returns, are collapsed to a single space
+WHITESPACE_CLEANER = re.compile(r"\s+")
 
 
 class TokenError(Exception):
@@ -101,7 +105,34 @@ class TOKENS(int):
     LIST = 20
 
 
-@lru_cache(64)
+# the words with a fixed meaning, the functions, operators and aggregators are
+# checked in that order, so they're added in reverse so the first one wins
+KEYWORDS = {
+    "TRUE": TOKENS.BOOLEAN,
+    "FALSE": TOKENS.BOOLEAN,
+    "NULL": TOKENS.NULL,
+    "NONE": TOKENS.NULL,
+    "AND": TOKENS.AND,
+    "OR": TOKENS.OR,
+    "NOT": TOKENS.NOT,
+    "AS": TOKENS.AS,
+    **{aggregator: TOKENS.AGGREGATOR for aggregator in AGGREGATORS},
+    **{operator: TOKENS.OPERATOR for operator in OPERATORS},
+    **{function: TOKENS.FUNCTION for function in FUNCTIONS},
+}
+
+
+# numbers start with a digit, a sign or a decimal point - except the special
+# values `float` understands
+NUMERIC_PREFIXES = {"+", "-", "."}
+NON_FINITE_FLOATS = {"NAN", "INF", "INFINITY"}
+
+
+# the tokens which keep the case they were written in
+CASE_SENSITIVE_TOKENS = {TOKENS.LITERAL, TOKENS.VARIABLE, TOKENS.SUBQUERY}
+
+
+@lru_cache(4096)
 def get_token_type(token):
     """
     Guess the token type.
@@ -116,12 +147,9 @@ def get_token_type(token):
         return TOKENS.VARIABLE
     if token == "*":  # nosec - not a password
         return TOKENS.EVERYTHING
-    if token_upper in FUNCTIONS:
-        return TOKENS.FUNCTION
-    if token_upper in OPERATORS:
-        return TOKENS.OPERATOR
-    if token_upper in AGGREGATORS:
-        return TOKENS.AGGREGATOR
+    keyword = KEYWORDS.get(token_upper)
+    if keyword is not None:
+        return keyword
     if token[0] == token[-1] == '"' or token[0] == token[-1] == "'":
         # tokens in quotes are either dates or string literals, if we can
         # parse to a date, it's a date
@@ -130,17 +158,25 @@ def get_token_type(token):
         else:
             return TOKENS.LITERAL
 
-    try:
-        num = int(token)
-        return TOKENS.INTEGER
-    except ValueError:
-        pass
-
-    try:
-        num = float(token)
-        return TOKENS.FLOAT
-    except ValueError:
-        pass
+    # only try to convert tokens which could be numbers, most tokens aren't and
+    # raising the exceptions from failed conversions is relatively expensive
+    first_char = token[0]
+    if (
+        first_char.isdecimal()
+        or first_char in NUMERIC_PREFIXES
+        or token_upper in NON_FINITE_FLOATS
+    ):
+        try:
+            int(token)
+            return TOKENS.INTEGER
+        except ValueError:
+            pass
+
+        try:
+            float(token)
+            return TOKENS.FLOAT
+        except ValueError:
+            pass
 
     if token in ("(", "["):
         return TOKENS.LEFTPARENTHESES
@@ -148,21 +184,9 @@ def get_token_type(token):
         return TOKENS.RIGHTPARENTHESES
     if token == ",":  # nosec
         return TOKENS.COMMA
-    if re.search(r"^[^\d\W][\w\-\.]*", token):
-        if token_upper in ("TRUE", "FALSE"):
-            # 'true' and 'false' without quotes are booleans
-            return TOKENS.BOOLEAN
-        if token_upper in ("NULL", "NONE"):
-            # 'null' or 'none' without quotes are nulls
-            return TOKENS.NULL
-        if token_upper == "AND":  # nosec - not a password
-            return TOKENS.AND
-        if token_upper == "OR":  # nosec - not a password
-            return TOKENS.OR
-        if token_upper == "NOT":  # nosec - not a password
-            return TOKENS.NOT
-        if token_upper == "AS":  # nosec - not a password
-            return TOKENS.AS
+    # this is the same test as the regex `^[^\d\W]`, i.e. the token starts with
+    # a word character which isn't a digit, without running a regex
+    if first_char == "_" or (first_char.isalnum() and not first_char.isdecimal()):
         # tokens starting with a letter, is made up of letters, numbers,
         # hyphens, underscores and dots are probably variables. We do this
         # last so we don't miss assign other items to be a variable
@@ -211,7 +235,7 @@ def build_splitter():
 
 class Tokenizer:
 
-    slots = ("i", "tokens")
+    __slots__ = ("i", "tokens")
 
     def __init__(self, exp):
         self.i = 0
@@ -251,34 +275,32 @@ class Tokenizer:
             stripped_token = token.strip()
             if len(stripped_token) == 0:
                 # the splitter creates unwanted empty strings
-                pass
+                continue
+
+            first_char = stripped_token[0]
+            last_char = stripped_token[-1]
+            is_quoted = first_char in QUOTE_CHARACTERS
 
-            elif not looking_for_end_char and stripped_token[0] not in ('"', "'", "`"):
+            if not looking_for_end_char and not is_quoted:
                 # nothing interesting here
                 yield token
 
-            elif (
-                stripped_token[0] in ('"', "'", "`")
-                and stripped_token[-1] == stripped_token[0]
-                and len(stripped_token) > 1
-            ):
+            elif is_quoted and last_char == first_char and len(stripped_token) > 1:
                 # the quotes wrap the entire token
                 yield token
 
-            elif stripped_token[-1] == looking_for_end_char:
+            elif last_char == looking_for_end_char:
                 # we've found the end of the token, yield it and reset
                 builder += token
                 yield builder
                 builder = ""
                 looking_for_end_char = None
 
-            elif stripped_token[0] in ('"', "'", "`") and (
-                stripped_token[-1] != stripped_token[0] or len(stripped_token) == 1
-            ):
-                # we've found a new token to collect
-                # the last character will always equal the last character if there's only one
+            elif is_quoted:
+                # we've found a new token to collect, the check above means
+                # the token is either a lone quote or doesn't end with its quote
                 builder = token
-                looking_for_end_char = stripped_token[0]
+                looking_for_end_char = first_char
 
             elif looking_for_end_char:
                 # we're building a token
@@ -289,31 +311,25 @@ class Tokenizer:
                     "Unable to determine quoted token boundaries, you may be missing a closing quote."
                 )
 
-    def _case_correction(self, tokens):
-        for token in tokens:
-            if get_token_type(token) in (
-                TOKENS.LITERAL,
-                TOKENS.VARIABLE,
-                TOKENS.SUBQUERY,
-            ):
-                yield token
-            else:
-                yield token.upper()
-
     def clean_statement(self, string):
         """
         Remove carriage returns and all whitespace to single spaces
         """
-        whitespace_cleaner = re.compile(r"\s+")
-        return whitespace_cleaner.sub(" ", string).strip()
+        return WHITESPACE_CLEANER.sub(" ", string).strip()
 
     def tokenize(self, expression):
         expression = self.clean_statement(expression)
-        tokens = build_splitter().split(expression)
-        # characters like '*' in literals break the tokenizer, so we need to fix them
-        tokens = list(self._fix_special_chars(tokens))
-        tokens = [t.strip() for t in tokens if t.strip() != ""]
-        tokens = list(self._case_correction(tokens))
+        tokens = []
+        # characters like '*' in literals break the tokenizer, so we need to fix
+        # them, then strip, drop the empty tokens and upper-case everything but
+        # literals and variables, in one pass of the tokens
+        for token in self._fix_special_chars(build_splitter().split(expression)):
+            token = token.strip()
+            if token == "":
+                continue
+            if get_token_type(token) not in CASE_SENSITIVE_TOKENS:
+                token = token.upper()
+            tokens.append(token)
         return tokens
 
     def __str__(self):
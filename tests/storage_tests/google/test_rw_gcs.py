@@ -89,8 +89,36 @@ def test_gcs_text():
     assert r.count() == 250, r
 
 
+def test_gcs_commit_many():
+
+    # set up
+    set_up()
+
+    w = GoogleCloudStorageWriter(
+        project="testing", dataset=f"{BUCKET_NAME}/test/gcs/dataset/many"
+    )
+    items = [
+        (f"test/gcs/dataset/many/blob-{i}.txt", f"blob number {i}".encode())
+        for i in range(10)
+    ]
+    # any bytes-like object can be committed
+    items.append(("test/gcs/dataset/many/blob-array.txt", bytearray(b"a bytearray")))
+
+    committed = w.commit_many(items, max_concurrency=4)
+    assert committed == [name for name, data in items], committed
+
+    # read each of the blobs back
+    r = GoogleCloudStorageReader(
+        project="testing", dataset=f"{BUCKET_NAME}/test/gcs/dataset/many"
+    )
+    for name, data in items:
+        blob = r.get_blob_bytes(f"{BUCKET_NAME}/{name}")
+        assert blob == bytes(data), name
+
+
 if __name__ == "__main__":  # pragma: no cover
     test_gcs_binary()
     test_gcs_text()
+    test_gcs_commit_many()
 
     print("okay")
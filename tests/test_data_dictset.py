@@ -1,5 +1,8 @@
 import os
 import sys
+import statistics
+import pytest
+from siphashc import siphash
 
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 from mabel import Reader, DictSet
@@ -42,6 +45,12 @@ def test_enumeration():
             pass
         assert i + 1 == 50, f"{storage_class} {i+1}"
 
+    # lists are iterable but aren't iterators
+    data = [{"a": 1}, {"a": 2}, {"a": 3}]
+    for storage_class in STORAGE_CLASSES:
+        ds = DictSet(data, storage_class=storage_class)
+        assert len(list(ds)) == 3, storage_class
+
 
 def test_sample():
     for storage_class in STORAGE_CLASSES:
@@ -84,17 +93,16 @@ def test_keys():
 
 def test_types():
     for storage_class in STORAGE_CLASSES:
-        if storage_class != STORAGE_CLASS.NO_PERSISTANCE:
-            ds = get_ds(persistence=storage_class)
-            types = ds.types()
-            assert types["userid"] == "int", types
-            assert types["username"] == "str"
-            assert types["user_verified"] == "bool"
-            assert types["followers"] == "int"
-            assert types["tweet"] == "str"
-            assert types["location"] == "str"
-            assert types["sentiment"] == "numeric"
-            assert types["timestamp"] == "str"
+        ds = get_ds(persistence=storage_class)
+        types = ds.types()
+        assert types["userid"] == "int", types
+        assert types["username"] == "str"
+        assert types["user_verified"] == "bool"
+        assert types["followers"] == "int"
+        assert types["tweet"] == "str"
+        assert types["location"] == "str"
+        assert types["sentiment"] == "numeric"
+        assert types["timestamp"] == "str"
 
 
 def test_distinct():
@@ -106,6 +114,16 @@ def test_distinct():
             assert ds.distinct("username", "location").count() == 2, storage_class
             assert ds.distinct("sentiment").count() == 36, storage_class
 
+    data = [{"a": "ab", "b": "c"}, {"a": "a", "b": "bc"}, {"a": "ab", "b": "c"}]
+    ds = DictSet(data, storage_class=STORAGE_CLASS.MEMORY)
+    assert ds.distinct("a", "b").count() == 2
+
+    # records (and values) with keys which aren't strings
+    data = [{1: "a", "b": {2: "c"}}, {1: "a", "b": {2: "c"}}, {1: "b", "b": {2: "c"}}]
+    ds = DictSet(data, storage_class=STORAGE_CLASS.MEMORY)
+    assert ds.distinct().count() == 2
+    assert ds.distinct("b").count() == 1
+
 
 def test_summary():
     data = [
@@ -127,6 +145,28 @@ def test_summary():
     assert ds.standard_deviation("key") == 1.2909944487358056
     assert ds.variance("key") == 1.6666666666666667
 
+    # like min and max, min_max fails for a column with no values
+    for aggregation in (ds.min, ds.max, ds.min_max):
+        with pytest.raises(ValueError):
+            aggregation("missing")
+
+
+def test_variance():
+    # the single pass variance isn't bit-for-bit the same as statistics
+    values = [(i * 7919 % 1000) / 7 for i in range(1000)]
+    ds = DictSet([{"key": v} for v in values], storage_class=STORAGE_CLASS.MEMORY)
+    assert ds.variance("key") == pytest.approx(statistics.variance(values))
+    assert ds.standard_deviation("key") == pytest.approx(statistics.stdev(values))
+
+    tweets = get_ds(persistence=STORAGE_CLASS.MEMORY)
+    sentiment = tweets.collect_list("sentiment")
+    assert tweets.variance("sentiment") == pytest.approx(
+        statistics.variance(sentiment)
+    )
+
+    with pytest.raises(statistics.StatisticsError):
+        DictSet([{"key": 1}], storage_class=STORAGE_CLASS.MEMORY).variance("key")
+
 
 def test_take():
     data = [
@@ -159,12 +199,13 @@ def test_items():
         {"key": 3, "value": "three", "plus1": 4},
         {"key": 4, "value": "four", "plus1": 5},
     ]
-    ds = DictSet(data, storage_class=STORAGE_CLASS.DISK)
-    items = list(ds.get_items(0, 2))
-    assert items == [
-        {"key": 1, "value": "one", "plus1": 2},
-        {"key": 3, "value": "three", "plus1": 4},
-    ], items
+    for storage_class in STORAGE_CLASSES:
+        ds = DictSet(iter(data), storage_class=storage_class)
+        items = list(ds.get_items(0, 2))
+        assert items == [
+            {"key": 1, "value": "one", "plus1": 2},
+            {"key": 3, "value": "three", "plus1": 4},
+        ], (storage_class, items)
 
 
 def test_filters():
@@ -195,6 +236,27 @@ def test_hash():
     hashval = hash(ds)
     assert hashval == 5233449951214716413, hashval
 
+    # nested dicts are hashed in the order they're in
+    nested = DictSet(
+        [{"value": {"b": 1, "a": 2}, "key": 1}], storage_class=STORAGE_CLASS.MEMORY
+    )
+    assert nested.__hash__() == 703115 ^ siphash(
+        "TheApolloMission", b'{"key":1,"value":{"b":1,"a":2}}'
+    )
+
+
+def test_select():
+    data = [{"a": 1, "b": 2}, {"a": 3, "c": 4}]
+    ds = DictSet(data, storage_class=STORAGE_CLASS.MEMORY)
+    assert list(ds.select("a")) == [{"a": 1}, {"a": 3}]
+    assert list(ds.select(["a", "c"])) == [{"a": 1, "c": None}, {"a": 3, "c": 4}]
+
+    class Column(str):
+        def __repr__(self):
+            raise AssertionError("the column name shouldn't be used as code")
+
+    assert list(ds.select([Column("b")])) == [{"b": 2}, {"b": None}]
+
 
 def test_sort():
     data = [
@@ -213,6 +275,32 @@ def test_sort():
     ], st
 
 
+def test_to_pandas():
+    data = [
+        {"key": 1, "value": "one"},
+        {"key": 2},
+        {"value": "three", "plus1": 4},
+    ]
+    ds = DictSet(data, storage_class=STORAGE_CLASS.MEMORY)
+    df = ds.to_pandas()
+    assert list(df.columns) == ["key", "value", "plus1"], df.columns
+    assert len(df) == 3, len(df)
+    assert df["value"].isna().tolist() == [False, True, False]
+    assert df["plus1"].isna().tolist() == [True, True, False]
+
+
+def test_memory_list_ownership():
+    data = [{"key": 1}, {"key": 2}]
+    ds = DictSet(data, storage_class=STORAGE_CLASS.MEMORY)
+    # the DictSet uses the list it was given, the count follows changes to it
+    data.append({"key": 3})
+    assert ds.count() == 3, ds.count()
+    assert len(list(ds)) == 3
+    data.pop(0)
+    assert ds.count() == 2, ds.count()
+    assert list(ds.get_items(0, 1)) == [{"key": 2}, {"key": 3}]
+
+
 if __name__ == "__main__":
     test_count()
     test_enumeration()
@@ -223,10 +311,14 @@ if __name__ == "__main__":
     test_distinct()
     test_types()
     test_summary()
+    test_variance()
     test_take()
     test_items()
     test_filters()
     test_hash()
+    test_select()
     test_sort()
+    test_to_pandas()
+    test_memory_list_ownership()
 
     print("OKAY")
@@ -237,6 +237,52 @@ def test_call_alias():
     assert test(TEST_DATA)
 
 
+def test_repeated_schemas():
+
+    TEST_SCHEMA = {"fields": [{"name": "number_field", "type": "NUMERIC"}]}
+
+    first = Schema(TEST_SCHEMA)
+    second = Schema(TEST_SCHEMA)
+
+    # the errors belong to each Schema even when the definition is reused
+    assert not first.validate({"number_field": "one hundred"})
+    assert second.validate({"number_field": 100})
+    assert first.last_error != ""
+    assert second.last_error == ""
+
+    # the shared parts of the Schemas can't be changed through either Schema
+    with pytest.raises(AttributeError):
+        first.columns.add("extra")
+    with pytest.raises(TypeError):
+        first._validators["extra"] = None
+    assert second.columns == {"number_field"}
+
+
+def test_validate_frame():
+    import pandas
+
+    TEST_SCHEMA = {
+        "fields": [
+            {"name": "string_field", "type": "VARCHAR"},
+            {"name": "number_field", "type": "NUMERIC"},
+            {"name": "date_field", "type": "TIMESTAMP"},
+        ]
+    }
+    TEST_DATA = [
+        {"string_field": "a", "number_field": 1, "date_field": datetime.datetime.now()},
+        {"string_field": 2, "number_field": 2},
+        {"string_field": "c", "number_field": None, "extra": True},
+        {"number_field": 4.5, "date_field": "2022-02-16"},
+        {},
+    ]
+
+    test = Schema(TEST_SCHEMA)
+    frame = pandas.DataFrame(TEST_DATA)
+    mask = test.validate_frame(frame)
+    assert mask.tolist() == [True, False, False, False, True], mask.tolist()
+    assert mask.tolist() == [test.validate(row) for row in TEST_DATA]
+
+
 if __name__ == "__main__":  # pragma: no cover
     test_validator_all_valid_values()
     test_validator_invalid_string()
@@ -251,5 +297,7 @@ if __name__ == "__main__":  # pragma: no cover
     test_unknown_type()
     test_raise_exception()
     test_call_alias()
+    test_repeated_schemas()
+    test_validate_frame()
 
     print("okay")
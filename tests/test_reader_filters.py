@@ -1,10 +1,12 @@
 import os
 import sys
+import pytest
 
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 from mabel.adapters.disk import DiskReader
 from mabel.data.internals.dnf_filters import DnfFilters
 from mabel.data.internals.dictset import STORAGE_CLASS
+from mabel.data.internals.index import Index
 from mabel.data import Reader
 from rich import traceback
 
@@ -54,6 +56,84 @@ def test_reader_filters_multiple_filter():
     assert r.count() == 34, r
 
 
+def test_reader_filters_with_select():
+    """the filter can run before or after the select, the results are the same"""
+    for select, count in (
+        ("username, timestamp", 34),
+        ("*", 34),
+        ("username AS user, timestamp", 34),
+        ("UPPER(username) AS username, timestamp", 0),
+    ):
+        r = Reader(
+            inner_reader=DiskReader,
+            dataset="tests/data/tweets/",
+            raw_path=True,
+            select=select,
+            filters="username = 'NBCNews' and timestamp >= '2020-01-12T07:11:04'",
+            persistence=STORAGE_CLASS.MEMORY,
+        )
+        assert r.count() == count, f"{select} {r.count()}"
+
+
+def test_reader_filters_not_in_dnf():
+    """filters which can't be evaluated as DNF are still evaluated as Expressions"""
+    for filters, count in (
+        ("username IS NOT NULL", 50),
+        ("username NOT LIKE '%NBC%'", 6),
+        ("NOT username = 'NBCNews'", 6),
+        ("a = 1 and b = 2 and c = 3", 0),
+        ("(a = 1 or a = 2) and b > 1", 0),
+        ("username = 'NBCNews' and username = 'NBCNews' and username = 'NBCNews'", 44),
+        ("(username = 'NBCNews' or username = 'BBCNews') and followers > 1", 50),
+    ):
+        r = Reader(
+            inner_reader=DiskReader,
+            dataset="tests/data/tweets/",
+            raw_path=True,
+            filters=filters,
+            persistence=STORAGE_CLASS.MEMORY,
+        )
+        assert r.count() == count, f"{filters} {r.count()}"
+
+
+def test_reader_filters_partially_indexed():
+    """only some of the filtered fields are indexed, no matching rows are lost"""
+    import shutil
+    from pathlib import Path
+    import orjson
+
+    folder = Path("_temp/indexed")
+    if folder.exists():  # pragma: no cover
+        shutil.rmtree(folder)
+    folder.mkdir(parents=True)
+
+    data = [
+        {"a": 1, "b": 10},
+        {"a": 1, "b": 2},
+        {"a": 2, "b": 0},
+        {"a": 3, "b": 9},
+    ]
+    with open(folder / "data.jsonl", "wb") as data_file:
+        data_file.write(b"\n".join(orjson.dumps(row) for row in data))
+    Index.build_index(data, "a").dump(str(folder / "data.jsonl.a.idx"))
+
+    for filters, expected in (
+        ([[("a", "==", 1), ("b", ">", 5)], [("a", "==", 2)]], [0, 2]),
+        ([("a", "==", 1), ("b", ">", 5)], [0]),
+        ([("b", ">", 5), ("a", "==", 1)], [0]),
+        ([[("a", "==", 1)], [("b", "==", 9)]], [0, 1, 3]),
+    ):
+        r = Reader(
+            inner_reader=DiskReader,
+            dataset=str(folder),
+            raw_path=True,
+            filters=filters,
+            persistence=STORAGE_CLASS.MEMORY,
+        )
+        rows = [data.index(row) for row in r]
+        assert sorted(rows) == expected, f"{filters} {rows}"
+
+
 def test_filters():
 
     d = DnfFilters(filters=[("age", "==", 11), ("gender", "in", ("a", "b", "male"))])
@@ -122,13 +202,26 @@ def test_combined_filters():
     assert len([a for a in filter08.filter_dictset(TEST_DATA)]) == 1
 
 
+def test_unknown_operator():
+
+    # creating the filter doesn't check the operators
+    d = DnfFilters(filters=[("age", "!!", 11)])
+    # but using it does, even if none of the records have the field
+    with pytest.raises(KeyError):
+        list(d.filter_dictset([{"name": "Harry Potter"}]))
+
+
 if __name__ == "__main__":  # pragma: no cover
     test_reader_filters_no_filter()
     test_reader_filters_single_filter()
     test_reader_filters_multiple_filter()
+    test_reader_filters_with_select()
+    test_reader_filters_not_in_dnf()
+    test_reader_filters_partially_indexed()
     test_filters()
     test_empty_filters()
     test_like_filters()
     test_combined_filters()
+    test_unknown_operator()
 
     print("okay")
@@ -1,4 +1,3 @@
-import time
 import os
 import sys
 
@@ -26,7 +25,7 @@ DATA_SET = [
     {"key": "two"},
     {"key": 1},
 ]
-SCHEMA = {"fields": [{"name": "key", "type": "NUMERIC"}]}
+SCHEMA = Schema({"fields": [{"name": "key", "type": "NUMERIC"}]})
 TEST_FOLDER = "_temp/path"
 
 
@@ -38,14 +37,14 @@ def test_writer_backout():
     w = StreamWriter(
         dataset=TEST_FOLDER,
         inner_writer=DiskWriter,
-        schema=Schema(SCHEMA),
+        schema=SCHEMA,
         idle_timeout_seconds=1,
     )
 
     for record in DATA_SET:
         w.append(record)
 
-    time.sleep(4)
+    assert w.wait_idle(5)
 
     r = Reader(dataset=TEST_FOLDER, inner_reader=DiskReader)
 
@@ -1,16 +1,32 @@
 import time
 import os
 import sys
+import threading
 
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 from mabel.adapters.null import NullWriter
 from mabel.data import StreamWriter
+from mabel.data.writers.internals.base_inner_writer import BaseInnerWriter
 from rich import traceback
 from freezegun import freeze_time
 
 traceback.install()
 
 
+class BlockingWriter(BaseInnerWriter):
+    """commits wait until they're released, so we can append during a commit"""
+
+    committing = threading.Event()
+    release = threading.Event()
+    committed: list = []
+
+    def commit(self, byte_data, override_blob_name=None):
+        BlockingWriter.committing.set()
+        BlockingWriter.release.wait(10)
+        BlockingWriter.committed.append(byte_data)
+        return self._build_path()
+
+
 def test_stream_rollover():
 
     # none of these should do anything
@@ -20,6 +36,11 @@ def test_stream_rollover():
         idle_timeout_seconds=1,
         format="text",
     )
+    # freezegun doesn't freeze time for threads, so the pool attendant would see
+    # the writers as years old and could evict them between appends - this test
+    # is about the date partitions, so stop the attendant
+    w.run_pool_attendant = False
+    w.thread.join()
 
     with freeze_time("2012-01-14"):
         lines = w.append("It's 2012")
@@ -33,7 +54,37 @@ def test_stream_rollover():
         lines = w.append("It's still 2017")
         assert lines == 2
 
-    time.sleep(2)
+    w.finalize()
+
+
+def test_rollover_during_append():
+
+    w = StreamWriter(
+        dataset="bucket/path/file.extension",
+        inner_writer=BlockingWriter,
+        idle_timeout_seconds=0,
+        format="jsonl",
+    )
+
+    assert w.append({"record": 1}) == 1
+    # the attendant evicts the idle writer and starts committing it
+    assert BlockingWriter.committing.wait(5)
+
+    # appending while the evicted writer is committing doesn't wait for the
+    # commit, the record goes to a new writer
+    result = []
+    appender = threading.Thread(target=lambda: result.append(w.append({"record": 2})))
+    appender.start()
+    appender.join(5)
+    assert not appender.is_alive()
+    assert result == [1], result
+    assert not w.wait_idle(0)
+
+    BlockingWriter.release.set()
+    assert w.wait_idle(5)
+    assert len(BlockingWriter.committed) == 2, BlockingWriter.committed
+    assert b'"record":1' in BlockingWriter.committed[0]
+    assert b'"record":2' in BlockingWriter.committed[1]
 
 
 def test_fixed_dates():
@@ -64,6 +115,7 @@ def test_fixed_dates():
 
 if __name__ == "__main__":  # pragma: no cover
     test_stream_rollover()
+    test_rollover_during_append()
     test_fixed_dates()
 
     print("okay")